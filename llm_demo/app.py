@@ -12,34 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import json
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager
 from typing import Any, Optional
 
+import orjson
 import uvicorn
+from cachetools import TTLCache
 from fastapi import APIRouter, Body, FastAPI, HTTPException, Request
 from fastapi.responses import PlainTextResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from google.auth.transport import requests  # type:ignore
 from google.oauth2 import id_token  # type:ignore
-from markdown import markdown
+from markdown import Markdown
 from starlette.middleware.sessions import SessionMiddleware
 
 from orchestrator import createOrchestrator
 
 routes = APIRouter()
 templates = Jinja2Templates(directory="templates")
+# Reused across requests, building a Markdown instance sets up all its processors
+markdown_converter = Markdown()
+# Shared transport for fetching Google's token signing certs
+google_request = requests.Request()
+# Verified user info keyed by (ID token, client id), kept until the token expires
+user_info_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # FastAPI app startup event
     print("Loading application...")
+    # Compile templates up front so the first page load doesn't pay for it
+    for template_name in templates.env.list_templates():
+        templates.env.get_template(template_name)
     yield
     # FastAPI app shutdown event
-    await app.state.orchestrator.close_clients()
+    # Bound the wait so a stuck client session can't hold up shutdown
+    try:
+        await asyncio.wait_for(app.state.orchestrator.close_clients(), timeout=5.0)
+    except asyncio.TimeoutError:
+        print("Timed out closing orchestrator clients.")
 
 
 @routes.get("/")
@@ -148,22 +164,32 @@ async def chat_handler(request: Request, prompt: str = Body(embed=True)):
             status_code=400, detail="Error: Invoke index handler before start chatting"
         )
 
-    # Add user message to chat history
-    request.session["history"].append({"type": "human", "data": {"content": prompt}})
     orchestrator = request.app.state.orchestrator
     response = await orchestrator.user_session_invoke(request.session["uuid"], prompt)
     output = response.get("output")
     confirmation = response.get("confirmation")
     trace = response.get("trace")
+    # Record the turn in chat history once the orchestrator has answered
+    new_entries = [{"type": "human", "data": {"content": prompt}}]
+    if not confirmation:
+        new_entries.append({"type": "ai", "data": {"content": output}})
+    request.session["history"].extend(new_entries)
     # Return assistant response
     if confirmation:
-        return json.dumps(
-            {"type": "confirmation", "content": confirmation, "trace": trace}
+        return PlainTextResponse(
+            orjson.dumps(
+                {"type": "confirmation", "content": confirmation, "trace": trace}
+            )
         )
     else:
-        request.session["history"].append({"type": "ai", "data": {"content": output}})
-        return json.dumps(
-            {"type": "message", "content": markdown(output), "trace": trace}
+        return PlainTextResponse(
+            orjson.dumps(
+                {
+                    "type": "message",
+                    "content": markdown_converter.reset().convert(output),
+                    "trace": trace,
+                }
+            )
         )
 
 
@@ -220,16 +246,21 @@ def reset(request: Request):
 
 
 def get_user_info(user_id_token: str, client_id: str) -> dict[str, str]:
+    cached = user_info_cache.get((user_id_token, client_id))
+    if cached and cached[1] > time.time():
+        return cached[0]
     try:
         id_info = id_token.verify_oauth2_token(
-            user_id_token, requests.Request(), audience=client_id
+            user_id_token, google_request, audience=client_id
         )
-        return {
-            "user_img": id_info["picture"],
-            "name": id_info["name"],
-        }
     except ValueError as err:
         return {}
+    user_info = {
+        "user_img": id_info["picture"],
+        "name": id_info["name"],
+    }
+    user_info_cache[(user_id_token, client_id)] = (user_info, id_info["exp"])
+    return user_info
 
 
 def clear_user_info(session: dict[str, Any]):
@@ -13,5 +13,52 @@
 # limitations under the License.
 
 
+import time
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from google.oauth2 import id_token  # type:ignore
+
+from app import get_user_info, user_info_cache
+
+
 def test_empty():
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_user_info_cache():
+    user_info_cache.clear()
+    yield
+    user_info_cache.clear()
+
+
+def mock_id_info(exp: float) -> dict[str, Any]:
+    return {"picture": "test_user_img", "name": "test_user_name", "exp": exp}
+
+
+@patch.object(id_token, "verify_oauth2_token")
+def test_get_user_info_reuses_unexpired_token(m_verify_oauth2_token):
+    m_verify_oauth2_token.return_value = mock_id_info(time.time() + 3600)
+    expected = {"user_img": "test_user_img", "name": "test_user_name"}
+    assert get_user_info("token", "client_id") == expected
+    assert get_user_info("token", "client_id") == expected
+    assert m_verify_oauth2_token.call_count == 1
+
+
+@patch.object(id_token, "verify_oauth2_token")
+def test_get_user_info_reverifies_expired_token(m_verify_oauth2_token):
+    m_verify_oauth2_token.return_value = mock_id_info(time.time() - 1)
+    get_user_info("token", "client_id")
+    get_user_info("token", "client_id")
+    assert m_verify_oauth2_token.call_count == 2
+
+
+@patch.object(id_token, "verify_oauth2_token")
+def test_get_user_info_does_not_cache_invalid_token(m_verify_oauth2_token):
+    m_verify_oauth2_token.side_effect = ValueError("Token expired")
+    assert get_user_info("token", "client_id") == {}
+    assert get_user_info("token", "client_id") == {}
+    assert m_verify_oauth2_token.call_count == 2
+    assert len(user_info_cache) == 0
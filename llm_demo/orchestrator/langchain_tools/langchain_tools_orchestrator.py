@@ -110,11 +110,13 @@ class UserAgent:
 
 class LangChainToolsOrchestrator(BaseOrchestrator):
     _user_sessions: Dict[str, UserAgent]
+    _prompt: Optional[ChatPromptTemplate]
     # aiohttp context
     connector = None
 
     def __init__(self):
         self._user_sessions = {}
+        self._prompt = None
 
     @classproperty
     def kind(cls):
@@ -162,8 +164,13 @@ class LangChainToolsOrchestrator(BaseOrchestrator):
         history = self.parse_messages(session["history"])
         client = await self.create_client_session()
         tools = await initialize_tools(client)
-        prompt = self.create_prompt_template(tools)
-        agent = UserAgent.initialize_agent(client, tools, history, prompt, self.MODEL)
+        # Tool names and descriptions are the same for every session, so the
+        # prompt only needs to be built once
+        if self._prompt is None:
+            self._prompt = self.create_prompt_template(tools)
+        agent = UserAgent.initialize_agent(
+            client, tools, history, self._prompt, self.MODEL
+        )
         self._user_sessions[id] = agent
         self.confirmation_needing_tools = get_confirmation_needing_tools()
         self.client = client
@@ -270,7 +277,7 @@ class LangChainToolsOrchestrator(BaseOrchestrator):
         close_client_tasks = [
             asyncio.create_task(a.close()) for a in self._user_sessions.values()
         ]
-        await asyncio.gather(*close_client_tasks)
+        await asyncio.gather(*close_client_tasks, return_exceptions=True)
 
 
 PREFIX = """The Cymbal Air Customer Service Assistant helps customers of Cymbal Air with their travel needs.
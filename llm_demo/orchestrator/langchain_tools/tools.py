@@ -26,6 +26,8 @@ from pydantic import BaseModel, Field
 
 BASE_URL = os.getenv("BASE_URL", default="http://127.0.0.1:8080")
 CREDENTIALS = None
+# Shared auth transport so token refreshes reuse one HTTP session
+AUTH_REQUEST = Request()
 
 
 def filter_none_values(params: Dict) -> Dict:
@@ -39,12 +41,12 @@ def get_id_token():
         if not hasattr(CREDENTIALS, "id_token"):
             # Use Compute Engine default credential
             CREDENTIALS = compute_engine.IDTokenCredentials(
-                request=Request(),
+                request=AUTH_REQUEST,
                 target_audience=BASE_URL,
                 use_metadata_identity_endpoint=True,
             )
     if not CREDENTIALS.valid:
-        CREDENTIALS.refresh(Request())
+        CREDENTIALS.refresh(AUTH_REQUEST)
     if hasattr(CREDENTIALS, "id_token"):
         return CREDENTIALS.id_token
     else:
@@ -263,7 +263,7 @@ class FunctionCallingOrchestrator(BaseOrchestrator):
         close_client_tasks = [
             asyncio.create_task(a.close()) for a in self._user_sessions.values()
         ]
-        await asyncio.gather(*close_client_tasks)
+        await asyncio.gather(*close_client_tasks, return_exceptions=True)
 
 
 PREFIX = """The Cymbal Air Customer Service Assistant helps customers of Cymbal Air with their travel needs.
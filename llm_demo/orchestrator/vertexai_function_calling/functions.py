@@ -16,10 +16,15 @@ import json
 import os
 
 import aiohttp
+import google.oauth2.id_token  # type: ignore
+from google.auth import compute_engine  # type: ignore
+from google.auth.transport.requests import Request  # type: ignore
 from vertexai.preview import generative_models  # type: ignore
 
 BASE_URL = os.getenv("BASE_URL", default="http://127.0.0.1:8080")
 CREDENTIALS = None
+# Shared auth transport so token refreshes reuse one HTTP session
+AUTH_REQUEST = Request()
 
 search_airports_func = generative_models.FunctionDeclaration(
     name="airports_search",
@@ -59,7 +64,9 @@ search_amenities_func = generative_models.FunctionDeclaration(
             "query": {"type": "string", "description": "Search query"},
             "top_k": {
                 "type": "integer",
-                "description": "Number of matching amenities to return. Default this value to 5.",
+                "description": "Number of matching amenities to return, between 1 and 100. Default this value to 5.",
+                "minimum": 1,
+                "maximum": 100,
             },
         },
         "required": ["query", "top_k"],
@@ -75,9 +82,12 @@ search_policies_func = generative_models.FunctionDeclaration(
             "query": {"type": "string", "description": "Search query"},
             "top_k": {
                 "type": "integer",
-                "description": "Number of matching policy to return. Default this value to 5.",
+                "description": "Number of matching policy to return, between 1 and 100. Default this value to 5.",
+                "minimum": 1,
+                "maximum": 100,
             },
         },
+        "required": ["query", "top_k"],
     },
 )
 
@@ -212,12 +222,12 @@ def get_id_token():
         if not hasattr(CREDENTIALS, "id_token"):
             # Use Compute Engine default credential
             CREDENTIALS = compute_engine.IDTokenCredentials(
-                request=Request(),
+                request=AUTH_REQUEST,
                 target_audience=BASE_URL,
                 use_metadata_identity_endpoint=True,
             )
     if not CREDENTIALS.valid:
-        CREDENTIALS.refresh(Request())
+        CREDENTIALS.refresh(AUTH_REQUEST)
     if hasattr(CREDENTIALS, "id_token"):
         return CREDENTIALS.id_token
     else:
@@ -18,6 +18,8 @@ from typing import Optional
 
 import yaml
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from google.auth.transport import requests  # type:ignore
 from langchain_google_vertexai import VertexAIEmbeddings
 from pydantic import BaseModel
 
@@ -46,6 +48,8 @@ def gen_init(cfg: AppConfig):
     async def initialize_datastore(app: FastAPI):
         app.state.datastore = await datastore.create(cfg.datastore)
         app.state.embed_service = VertexAIEmbeddings(model_name=EMBEDDING_MODEL_NAME)
+        # Shared transport for fetching Google's token signing certs
+        app.state.google_request = requests.Request()
         yield
         await app.state.datastore.close()
 
@@ -53,7 +57,7 @@ def gen_init(cfg: AppConfig):
 
 
 def init_app(cfg: AppConfig) -> FastAPI:
-    app = FastAPI(lifespan=gen_init(cfg))
+    app = FastAPI(lifespan=gen_init(cfg), default_response_class=ORJSONResponse)
     app.state.client_id = cfg.clientId
     app.include_router(routes)
     return app
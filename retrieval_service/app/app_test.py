@@ -12,17 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import time
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 from google.oauth2 import id_token
+from pydantic import ValidationError
 
 import datastore
 import models
 
 from . import init_app
+from .routes import embedding_cache, get_embed_service, user_info_cache
 
 
 @pytest.fixture(scope="module")
@@ -35,6 +38,13 @@ def app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_user_info_cache():
+    user_info_cache.clear()
+    yield
+    user_info_cache.clear()
+
+
 @patch.object(datastore, "create")
 def test_hello_world(m_datastore, app):
     m_datastore = AsyncMock()
@@ -435,6 +445,53 @@ def test_amenities_search(m_datastore, app, method_name, params, mock_return, ex
     assert models.Amenity.model_validate(output[0])
 
 
+@patch.object(datastore, "create")
+def test_amenities_search_reuses_query_embedding(m_datastore, app):
+    embedding_cache.clear()
+    m_embed_service = MagicMock()
+    m_embed_service.embed_query.return_value = [0.5, -0.25, 1.0]
+    app.dependency_overrides[get_embed_service] = lambda: m_embed_service
+    try:
+        with TestClient(app) as client:
+            with patch.object(
+                m_datastore.return_value,
+                "amenities_search",
+                AsyncMock(return_value=([], None)),
+            ) as mock_method:
+                for _ in range(2):
+                    response = client.get(
+                        "/amenities/search",
+                        params={"query": "A place to get food.", "top_k": 2},
+                    )
+                    assert response.status_code == 200
+    finally:
+        app.dependency_overrides.clear()
+        embedding_cache.clear()
+    assert m_embed_service.embed_query.call_count == 1
+    assert mock_method.call_count == 2
+    for call in mock_method.mock_calls:
+        assert call.args == ([0.5, -0.25, 1.0], 0.5, 2)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        pytest.param({"query": "", "top_k": 2}, id="empty_query"),
+        pytest.param({"query": "A place to get food.", "top_k": 0}, id="zero_top_k"),
+        pytest.param({"query": "A place to get food."}, id="no_top_k"),
+    ],
+)
+@patch.object(datastore, "create")
+def test_amenities_search_with_bad_params(m_datastore, app, params):
+    with TestClient(app) as client:
+        with patch.object(
+            m_datastore.return_value, "amenities_search", AsyncMock()
+        ) as mock_method:
+            response = client.get("/amenities/search", params=params)
+    assert response.status_code == 422
+    assert mock_method.call_count == 0
+
+
 get_flight_params = [
     pytest.param(
         "get_flight",
@@ -803,6 +860,39 @@ def test_policies_search(m_datastore, app, method_name, params, mock_return, exp
     assert models.Policy.model_validate(output[0])
 
 
+@pytest.mark.parametrize(
+    "embedding, expected",
+    [
+        pytest.param("[1.0, -2.5, 3e-2]", [1.0, -2.5, 0.03], id="values"),
+        pytest.param("[]", [], id="empty_list"),
+    ],
+)
+def test_policy_parses_embedding_string(embedding, expected):
+    policy = models.Policy.model_validate(
+        {"id": 1, "content": "foo", "embedding": embedding}
+    )
+    assert policy.embedding == expected
+
+
+@pytest.mark.parametrize(
+    "embedding",
+    [
+        pytest.param("[1.0, abc, 2.0]", id="bad_value"),
+        pytest.param("[1.0,,2.0]", id="missing_value"),
+        pytest.param("", id="empty"),
+        pytest.param("1.0, 2.0", id="no_brackets"),
+        pytest.param("[1.0, 2.0", id="unclosed"),
+        pytest.param("[1.0, nan]", id="nan"),
+        pytest.param("[inf, 1.0]", id="inf"),
+    ],
+)
+def test_policy_rejects_malformed_embedding(embedding):
+    with pytest.raises(ValidationError):
+        models.Policy.model_validate(
+            {"id": 1, "content": "foo", "embedding": embedding}
+        )
+
+
 @patch.object(datastore, "create")
 def test_insert_ticket_missing_user_info(m_datastore, app):
     m_datastore = AsyncMock()
@@ -823,6 +913,26 @@ def test_insert_ticket_missing_user_info(m_datastore, app):
         assert response.json()["detail"] == "User login required for data insertion"
 
 
+@pytest.mark.parametrize(
+    "headers, expected",
+    [
+        pytest.param({}, "no user authorization header", id="no_header"),
+        pytest.param(
+            {"User-Id-Token": "valid_token"}, "Invalid ID token", id="no_scheme"
+        ),
+        pytest.param(
+            {"User-Id-Token": "Basic valid_token"}, "Invalid ID token", id="bad_scheme"
+        ),
+    ],
+)
+@patch.object(datastore, "create")
+def test_list_tickets_with_bad_header(m_datastore, app, headers, expected):
+    with TestClient(app) as client:
+        response = client.get("/tickets/list", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == expected
+
+
 insert_ticket_params = [
     pytest.param(
         "insert_ticket",
@@ -1068,3 +1178,29 @@ def test_list_tickets(
                 assert mock_method.mock_calls[0].args[0] == mock_user_info["sub"]
             else:
                 assert mock_method.call_count == 0
+
+
+@patch.object(id_token, "verify_oauth2_token")
+@patch.object(datastore, "create")
+def test_list_tickets_reuses_verified_token(m_datastore, m_verify_oauth2_token, app):
+    with TestClient(app) as client:
+        with patch.object(
+            m_datastore.return_value,
+            "list_tickets",
+            AsyncMock(return_value=([], None)),
+        ) as mock_method:
+            m_verify_oauth2_token.return_value = {
+                "sub": 123,
+                "name": "test_user_name",
+                "email": "test_user_email",
+                "exp": time.time() + 3600,
+            }
+            for _ in range(2):
+                response = client.get(
+                    "/tickets/list",
+                    headers={"User-Id-Token": "Bearer cached_token"},
+                )
+                assert response.status_code == 200
+            assert m_verify_oauth2_token.call_count == 1
+            assert mock_method.call_count == 2
+            assert mock_method.mock_calls[1].args[0] == 123
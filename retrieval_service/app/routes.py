@@ -12,50 +12,91 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import hashlib
+import time
 from typing import Any, Mapping, Optional
 
-from fastapi import APIRouter, HTTPException, Request
-from google.auth.transport import requests  # type:ignore
+import numpy as np
+from cachetools import LRUCache, TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from google.oauth2 import id_token  # type:ignore
 from langchain_core.embeddings import Embeddings
 
 import datastore
 
 routes = APIRouter()
+# Verified user info keyed by (client id, hash of the ID token). Entries are
+# kept for at most 30s and never past the token's own expiry.
+user_info_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# Query embeddings keyed by (model name, query text), stored as float32 arrays
+# to keep the cache small
+embedding_cache: LRUCache = LRUCache(maxsize=4096)
 
 
-def _ParseUserIdToken(headers: Mapping[str, Any]) -> Optional[str]:
+def _ParseUserIdToken(headers: Mapping[str, Any]) -> str:
     """Parses the bearer token out of the request headers."""
     # authorization_header = headers.lower()
     user_id_token_header = headers.get("User-Id-Token")
     if not user_id_token_header:
-        raise Exception("no user authorization header")
+        raise HTTPException(status_code=401, detail="no user authorization header")
 
-    parts = str(user_id_token_header).split(" ")
-    if len(parts) != 2 or parts[0] != "Bearer":
-        raise Exception("Invalid ID token")
+    scheme, sep, token = str(user_id_token_header).partition(" ")
+    if not sep or scheme != "Bearer" or not token or " " in token:
+        raise HTTPException(status_code=401, detail="Invalid ID token")
 
-    return parts[1]
+    return token
 
 
 async def get_user_info(request):
     headers = request.headers
     token = _ParseUserIdToken(headers)
+    key = (
+        request.app.state.client_id,
+        hashlib.sha256(token.encode()).digest()[:16],
+    )
+    cached = user_info_cache.get(key)
+    if cached and cached[1] > time.time():
+        return cached[0]
     try:
-        id_info = id_token.verify_oauth2_token(
-            token, requests.Request(), audience=request.app.state.client_id
+        id_info = await asyncio.to_thread(
+            id_token.verify_oauth2_token,
+            token,
+            request.app.state.google_request,
+            audience=request.app.state.client_id,
         )
 
-        return {
+        user_info = {
             "user_id": id_info.get("sub"),
             "user_name": id_info.get("name"),
             "user_email": id_info.get("email"),
         }
+        user_info_cache[key] = (user_info, id_info.get("exp", 0))
+        return user_info
 
     except Exception as e:  # pylint: disable=broad-except
         print(e)
 
 
+async def embed_query(embed_service: Embeddings, query: str) -> list[float]:
+    """Embeds the query, running the blocking embeddings call off the event loop."""
+    key = (getattr(embed_service, "model_name", None), query)
+    embedding: Optional[np.ndarray] = embedding_cache.get(key)
+    if embedding is None:
+        values = await asyncio.to_thread(embed_service.embed_query, query)
+        embedding = np.asarray(values, dtype=np.float32)
+        embedding_cache[key] = embedding
+    return embedding.tolist()
+
+
+def get_datastore(request: Request) -> datastore.Client:
+    return request.app.state.datastore
+
+
+def get_embed_service(request: Request) -> Embeddings:
+    return request.app.state.embed_service
+
+
 @routes.get("/")
 async def root():
     return {"message": "Hello World"}
@@ -63,11 +104,10 @@ async def root():
 
 @routes.get("/airports")
 async def get_airport(
-    request: Request,
     id: Optional[int] = None,
     iata: Optional[str] = None,
+    ds: datastore.Client = Depends(get_datastore),
 ):
-    ds: datastore.Client = request.app.state.datastore
     if id:
         results, sql = await ds.get_airport_by_id(id)
     elif iata:
@@ -82,10 +122,10 @@ async def get_airport(
 
 @routes.get("/airports/search")
 async def search_airports(
-    request: Request,
     country: Optional[str] = None,
     city: Optional[str] = None,
     name: Optional[str] = None,
+    ds: datastore.Client = Depends(get_datastore),
 ):
     if country is None and city is None and name is None:
         raise HTTPException(
@@ -93,46 +133,44 @@ async def search_airports(
             detail="Request requires at least one query params: country, city, or airport name",
         )
 
-    ds: datastore.Client = request.app.state.datastore
     results, sql = await ds.search_airports(country, city, name)
     return {"results": results, "sql": sql}
 
 
 @routes.get("/amenities")
-async def get_amenity(id: int, request: Request):
-    ds: datastore.Client = request.app.state.datastore
+async def get_amenity(id: int, ds: datastore.Client = Depends(get_datastore)):
     results, sql = await ds.get_amenity(id)
     return {"results": results, "sql": sql}
 
 
 @routes.get("/amenities/search")
-async def amenities_search(query: str, top_k: int, request: Request):
-    ds: datastore.Client = request.app.state.datastore
-
-    embed_service: Embeddings = request.app.state.embed_service
-    query_embedding = embed_service.embed_query(query)
+async def amenities_search(
+    query: str = Query(min_length=1),
+    top_k: int = Query(gt=0, le=100),
+    ds: datastore.Client = Depends(get_datastore),
+    embed_service: Embeddings = Depends(get_embed_service),
+):
+    query_embedding = await embed_query(embed_service, query)
 
     results, sql = await ds.amenities_search(query_embedding, 0.5, top_k)
     return {"results": results, "sql": sql}
 
 
 @routes.get("/flights")
-async def get_flight(flight_id: int, request: Request):
-    ds: datastore.Client = request.app.state.datastore
+async def get_flight(flight_id: int, ds: datastore.Client = Depends(get_datastore)):
     results, sql = await ds.get_flight(flight_id)
     return {"results": results, "sql": sql}
 
 
 @routes.get("/flights/search")
 async def search_flights(
-    request: Request,
     departure_airport: Optional[str] = None,
     arrival_airport: Optional[str] = None,
     date: Optional[str] = None,
     airline: Optional[str] = None,
     flight_number: Optional[str] = None,
+    ds: datastore.Client = Depends(get_datastore),
 ):
-    ds: datastore.Client = request.app.state.datastore
     if date and (arrival_airport or departure_airport):
         results, sql = await ds.search_flights_by_airports(
             date, departure_airport, arrival_airport
@@ -156,6 +194,7 @@ async def insert_ticket(
     arrival_airport: str,
     departure_time: str,
     arrival_time: str,
+    ds: datastore.Client = Depends(get_datastore),
 ):
     user_info = await get_user_info(request)
     if user_info is None:
@@ -163,7 +202,6 @@ async def insert_ticket(
             status_code=401,
             detail="User login required for data insertion",
         )
-    ds: datastore.Client = request.app.state.datastore
     results = await ds.insert_ticket(
         user_info["user_id"],
         user_info["user_name"],
@@ -180,13 +218,12 @@ async def insert_ticket(
 
 @routes.get("/tickets/validate")
 async def validate_ticket(
-    request: Request,
     airline: str,
     flight_number: str,
     departure_airport: str,
     departure_time: str,
+    ds: datastore.Client = Depends(get_datastore),
 ):
-    ds: datastore.Client = request.app.state.datastore
     results, sql = await ds.validate_ticket(
         airline,
         flight_number,
@@ -199,6 +236,7 @@ async def validate_ticket(
 @routes.get("/tickets/list")
 async def list_tickets(
     request: Request,
+    ds: datastore.Client = Depends(get_datastore),
 ):
     user_info = await get_user_info(request)
     if user_info is None:
@@ -206,17 +244,18 @@ async def list_tickets(
             status_code=401,
             detail="User login required for data insertion",
         )
-    ds: datastore.Client = request.app.state.datastore
     results, sql = await ds.list_tickets(user_info["user_id"])
     return {"results": results, "sql": sql}
 
 
 @routes.get("/policies/search")
-async def policies_search(query: str, top_k: int, request: Request):
-    ds: datastore.Client = request.app.state.datastore
-
-    embed_service: Embeddings = request.app.state.embed_service
-    query_embedding = embed_service.embed_query(query)
+async def policies_search(
+    query: str = Query(min_length=1),
+    top_k: int = Query(gt=0, le=100),
+    ds: datastore.Client = Depends(get_datastore),
+    embed_service: Embeddings = Depends(get_embed_service),
+):
+    query_embedding = await embed_query(embed_service, query)
 
     results, sql = await ds.policies_search(query_embedding, 0.5, top_k)
     return {"results": results, "sql": sql}
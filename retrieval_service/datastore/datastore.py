@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import csv
 from abc import ABC, abstractmethod
 from typing import Any, Generic, List, Optional, TypeVar
 
+from pydantic import BaseModel
+
 import models
 
 
@@ -24,6 +27,14 @@ class AbstractConfig(ABC):
 
 
 C = TypeVar("C", bound=AbstractConfig)
+M = TypeVar("M", bound=BaseModel)
+
+
+def load_csv(path: str, model: type[M]) -> list[M]:
+    """Reads a CSV dataset and validates each row into the given model."""
+    with open(path, "r", newline="") as f:
+        reader = csv.DictReader(f, delimiter=",")
+        return [model.model_validate(line) for line in reader]
 
 
 class classproperty:
@@ -53,25 +64,12 @@ class Client(ABC, Generic[C]):
         List[models.Flight],
         List[models.Policy],
     ]:
-        airports: List[models.Airport] = []
-        with open(airports_ds_path, "r") as f:
-            reader = csv.DictReader(f, delimiter=",")
-            airports = [models.Airport.model_validate(line) for line in reader]
-
-        amenities: list[models.Amenity] = []
-        with open(amenities_ds_path, "r") as f:
-            reader = csv.DictReader(f, delimiter=",")
-            amenities = [models.Amenity.model_validate(line) for line in reader]
-
-        flights: List[models.Flight] = []
-        with open(flights_ds_path, "r") as f:
-            reader = csv.DictReader(f, delimiter=",")
-            flights = [models.Flight.model_validate(line) for line in reader]
-
-        policies: List[models.Policy] = []
-        with open(policies_ds_path, "r") as f:
-            reader = csv.DictReader(f, delimiter=",")
-            policies = [models.Policy.model_validate(line) for line in reader]
+        airports, amenities, flights, policies = await asyncio.gather(
+            asyncio.to_thread(load_csv, airports_ds_path, models.Airport),
+            asyncio.to_thread(load_csv, amenities_ds_path, models.Amenity),
+            asyncio.to_thread(load_csv, flights_ds_path, models.Flight),
+            asyncio.to_thread(load_csv, policies_ds_path, models.Policy),
+        )
         return airports, amenities, flights, policies
 
     async def export_dataset(
@@ -15,13 +15,13 @@
 import asyncio
 from datetime import datetime
 from ipaddress import IPv4Address, IPv6Address
-from typing import Any, Literal, Optional
+from typing import Any, Iterable, Literal, Optional
 
 import asyncpg
 from pgvector.asyncpg import register_vector
 from pydantic import BaseModel
 from sqlalchemy import text
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 import models
 
@@ -71,6 +71,16 @@ class Client(datastore.Client[Config]):
             raise TypeError("async_engine not instantiated")
         return cls(async_engine)
 
+    async def __copy_records(
+        self, conn: AsyncConnection, table_name: str, records: Iterable[tuple]
+    ) -> None:
+        """Bulk loads records into a table using the Postgres COPY protocol."""
+        raw_conn = await conn.get_raw_connection()
+        asyncpg_conn = raw_conn.driver_connection
+        if asyncpg_conn is None:
+            raise TypeError("asyncpg connection not available")
+        await asyncpg_conn.copy_records_to_table(table_name, records=records)
+
     async def initialize_data(
         self,
         airports: list[models.Airport],
@@ -96,20 +106,10 @@ class Client(datastore.Client[Config]):
                 )
             )
             # Insert all the data
-            await conn.execute(
-                text(
-                    """INSERT INTO airports VALUES (:id, :iata, :name, :city, :country)"""
-                ),
-                [
-                    {
-                        "id": a.id,
-                        "iata": a.iata,
-                        "name": a.name,
-                        "city": a.city,
-                        "country": a.country,
-                    }
-                    for a in airports
-                ],
+            await self.__copy_records(
+                conn,
+                "airports",
+                ((a.id, a.iata, a.name, a.city, a.country) for a in airports),
             )
 
             await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
@@ -148,45 +148,37 @@ class Client(datastore.Client[Config]):
                 )
             )
             # Insert all the data
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO amenities VALUES (:id, :name, :description, :location,
-                      :terminal, :category, :hour, :sunday_start_hour, :sunday_end_hour,
-                      :monday_start_hour, :monday_end_hour, :tuesday_start_hour,
-                      :tuesday_end_hour, :wednesday_start_hour, :wednesday_end_hour,
-                      :thursday_start_hour, :thursday_end_hour, :friday_start_hour,
-                      :friday_end_hour, :saturday_start_hour, :saturday_end_hour, :content, :embedding)
-                    """
-                ),
-                [
-                    {
-                        "id": a.id,
-                        "name": a.name,
-                        "description": a.description,
-                        "location": a.location,
-                        "terminal": a.terminal,
-                        "category": a.category,
-                        "hour": a.hour,
-                        "sunday_start_hour": a.sunday_start_hour,
-                        "sunday_end_hour": a.sunday_end_hour,
-                        "monday_start_hour": a.monday_start_hour,
-                        "monday_end_hour": a.monday_end_hour,
-                        "tuesday_start_hour": a.tuesday_start_hour,
-                        "tuesday_end_hour": a.tuesday_end_hour,
-                        "wednesday_start_hour": a.wednesday_start_hour,
-                        "wednesday_end_hour": a.wednesday_end_hour,
-                        "thursday_start_hour": a.thursday_start_hour,
-                        "thursday_end_hour": a.thursday_end_hour,
-                        "friday_start_hour": a.friday_start_hour,
-                        "friday_end_hour": a.friday_end_hour,
-                        "saturday_start_hour": a.saturday_start_hour,
-                        "saturday_end_hour": a.saturday_end_hour,
-                        "content": a.content,
-                        "embedding": a.embedding,
-                    }
+            await self.__copy_records(
+                conn,
+                "amenities",
+                (
+                    (
+                        a.id,
+                        a.name,
+                        a.description,
+                        a.location,
+                        a.terminal,
+                        a.category,
+                        a.hour,
+                        a.sunday_start_hour,
+                        a.sunday_end_hour,
+                        a.monday_start_hour,
+                        a.monday_end_hour,
+                        a.tuesday_start_hour,
+                        a.tuesday_end_hour,
+                        a.wednesday_start_hour,
+                        a.wednesday_end_hour,
+                        a.thursday_start_hour,
+                        a.thursday_end_hour,
+                        a.friday_start_hour,
+                        a.friday_end_hour,
+                        a.saturday_start_hour,
+                        a.saturday_end_hour,
+                        a.content,
+                        a.embedding,
+                    )
                     for a in amenities
-                ],
+                ),
             )
 
             # If the table already exists, drop it to avoid conflicts
@@ -210,28 +202,23 @@ class Client(datastore.Client[Config]):
                 )
             )
             # Insert all the data
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO flights VALUES (:id, :airline, :flight_number,
-                      :departure_airport, :arrival_airport, :departure_time,
-                      :arrival_time, :departure_gate, :arrival_gate)
-                    """
-                ),
-                [
-                    {
-                        "id": f.id,
-                        "airline": f.airline,
-                        "flight_number": f.flight_number,
-                        "departure_airport": f.departure_airport,
-                        "arrival_airport": f.arrival_airport,
-                        "departure_time": f.departure_time,
-                        "arrival_time": f.arrival_time,
-                        "departure_gate": f.departure_gate,
-                        "arrival_gate": f.arrival_gate,
-                    }
+            await self.__copy_records(
+                conn,
+                "flights",
+                (
+                    (
+                        f.id,
+                        f.airline,
+                        f.flight_number,
+                        f.departure_airport,
+                        f.arrival_airport,
+                        f.departure_time,
+                        f.arrival_time,
+                        f.departure_gate,
+                        f.arrival_gate,
+                    )
                     for f in flights
-                ],
+                ),
             )
 
             # If the table already exists, drop it to avoid conflicts
@@ -270,20 +257,10 @@ class Client(datastore.Client[Config]):
                 )
             )
             # Insert all the data
-            await conn.execute(
-                text(
-                    """
-                    INSERT INTO policies VALUES (:id, :content, :embedding)
-                    """
-                ),
-                [
-                    {
-                        "id": p.id,
-                        "content": p.content,
-                        "embedding": p.embedding,
-                    }
-                    for p in policies
-                ],
+            await self.__copy_records(
+                conn,
+                "policies",
+                ((p.id, p.content, p.embedding) for p in policies),
             )
             await conn.commit()
 
@@ -12,13 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import ast
 import datetime
 from typing import Optional
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, field_validator
 
 
+def parse_embedding(v: str) -> list[float]:
+    """Parses a "[f1, f2, ...]" embedding string, raising ValueError on bad values."""
+    v = v.strip()
+    if len(v) < 2 or v[0] != "[" or v[-1] != "]":
+        raise ValueError("embedding must be a bracketed list of numbers")
+    if not v[1:-1].strip():
+        return []
+    embedding = np.array(v[1:-1].split(","), dtype=np.float64)
+    if not np.isfinite(embedding).all():
+        raise ValueError("embedding values must be finite")
+    return embedding.tolist()
+
+
 class Airport(BaseModel):
     id: int
     iata: str
@@ -77,8 +90,7 @@ class Amenity(BaseModel):
     @field_validator("embedding", mode="before")
     def validate(cls, v):
         if isinstance(v, str):
-            v = ast.literal_eval(v)
-            v = [float(f) for f in v]
+            v = parse_embedding(v)
         return v
 
 
@@ -114,6 +126,5 @@ class Policy(BaseModel):
     @field_validator("embedding", mode="before")
     def validate(cls, v):
         if isinstance(v, str):
-            v = ast.literal_eval(v)
-            v = [float(f) for f in v]
+            v = parse_embedding(v)
         return v